@@ -1,8 +1,11 @@
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
+import pandas as pd
 import pytest
 
 import wearipedia
+from wearipedia.devices.biostrap.evo_gen import series_to_dict
 
 data_formats = {
     "bpm": (int, float),
@@ -57,6 +60,9 @@ def test_evo(real):
 
         # Checks specific to datetime-keyed data
         elif data_type in ["steps", "distance"]:
+            # Keys are plain datetime strings
+            for key in data.keys():
+                assert isinstance(key, str), f"{data_type} key {key} is not a str"
 
             datetimes = [
                 datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S") for dt_str in data.keys()
@@ -76,6 +82,15 @@ def test_evo(real):
                     datetimes[i] == expected_dt
                 ), f"Expected datetime {expected_dt}, but got {datetimes[i]}"
         else:
+            # Keys are (datetime string, timezone offset in minutes) tuples
+            for key in data.keys():
+                assert (
+                    isinstance(key, tuple)
+                    and len(key) == 2
+                    and isinstance(key[0], str)
+                    and key[1] == -420
+                ), f"{data_type} key {key} is not a (datetime string, -420) tuple"
+
             datetimes = [key[0] for key in data.keys()]
 
             # Check datetimes are within the range
@@ -90,3 +105,38 @@ def test_evo(real):
             assert isinstance(
                 value, data_format
             ), f"{data_type} data {value} is not a {data_format.__name__}"
+
+
+def test_evo_seed():
+    # Synthetic data should be reproducible from the seed alone
+    device = wearipedia.get_device("biostrap/evo", seed=0)
+    same_seed = wearipedia.get_device("biostrap/evo", seed=0)
+    other_seed = wearipedia.get_device("biostrap/evo", seed=1)
+
+    for data_type in ["bpm", "total_cals"]:
+        data = device.get_data(data_type)
+        assert data == same_seed.get_data(
+            data_type
+        ), f"{data_type} data differs between devices with the same seed"
+        assert data != other_seed.get_data(
+            data_type
+        ), f"{data_type} data is the same for devices with different seeds"
+
+
+def test_series_to_dict():
+    # The timezone offset is taken per reading, across a daylight saving time change
+    index = pd.date_range(
+        "2023-03-12 01:00", periods=3, freq="h", tz=ZoneInfo("America/Los_Angeles")
+    )
+    assert series_to_dict(pd.Series([1, 2, 3], index=index)) == {
+        ("2023-03-12 01:00:00", -480): 1,
+        ("2023-03-12 03:00:00", -420): 2,
+        ("2023-03-12 04:00:00", -420): 3,
+    }
+
+    # Naive series are keyed by plain datetime strings
+    index = pd.date_range("2023-06-05", periods=2, freq="min")
+    assert series_to_dict(pd.Series([4, 5], index=index)) == {
+        "2023-06-05 00:00:00": 4,
+        "2023-06-05 00:01:00": 5,
+    }
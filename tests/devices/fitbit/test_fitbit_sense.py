@@ -8,8 +8,18 @@ import wearipedia
 
 @pytest.mark.parametrize("real", [True, False])
 def test_fitbit_sense(real):
-    start_dates = [datetime(2009, 11, 30), datetime(2021, 4, 4), datetime(2022, 6, 10)]
-    end_dates = [datetime(2009, 12, 1), datetime(2021, 4, 5), datetime(2022, 6, 11)]
+    start_dates = [
+        datetime(2009, 11, 30),
+        datetime(2021, 4, 4),
+        datetime(2022, 6, 10),
+        datetime(2022, 8, 1),
+    ]
+    end_dates = [
+        datetime(2009, 12, 1),
+        datetime(2021, 4, 5),
+        datetime(2022, 6, 11),
+        datetime(2022, 8, 15),
+    ]
 
     for start_date, end_date in zip(start_dates, end_dates):
         device = wearipedia.get_device(
@@ -75,6 +85,41 @@ def helper_test(device, start_synthetic, end_synthetic, real):
             "end_date": datetime.strftime(end_synthetic, "%Y-%m-%d"),
         },
     )
+    # synthetic data holds one entry per day from the start date up to the end date
+    num_days = (end_synthetic - start_synthetic).days
+    sub_start = start_synthetic + timedelta(days=num_days // 3)
+    sub_end = end_synthetic - timedelta(days=num_days // 3 + 1)
+    for data_type, key in [
+        ("sleep", "sleep"),
+        ("steps", "activities-steps"),
+        ("minutesVeryActive", "activities-minutesVeryActive"),
+        ("minutesLightlyActive", "activities-minutesLightlyActive"),
+        ("minutesFairlyActive", "activities-minutesFairlyActive"),
+        ("distance", "activities-distance"),
+        ("minutesSedentary", "activities-minutesSedentary"),
+    ]:
+        full_range = device.get_data(
+            data_type,
+            params={
+                "start_date": datetime.strftime(start_synthetic, "%Y-%m-%d"),
+                "end_date": datetime.strftime(end_synthetic, "%Y-%m-%d"),
+            },
+        )
+        assert (
+            len(full_range[0][key]) == num_days
+        ), f"Expected {num_days} {data_type} entries but got {len(full_range[0][key])}"
+
+        sub_range = device.get_data(
+            data_type,
+            params={
+                "start_date": datetime.strftime(sub_start, "%Y-%m-%d"),
+                "end_date": datetime.strftime(sub_end, "%Y-%m-%d"),
+            },
+        )
+        assert (
+            len(sub_range[0][key]) == (sub_end - sub_start).days + 1
+        ), f"Expected {(sub_end - sub_start).days + 1} {data_type} entries but got {len(sub_range[0][key])}"
+
     minutesAsleep = []
     for datapoint in sleep[0]["sleep"]:
         minutesAsleep.append(datapoint["minutesAsleep"])
@@ -6,7 +6,6 @@ from urllib.parse import urlencode
 
 import requests
 
-from ...utils import seed_everything
 from ..device import BaseDevice
 from .evo_fetch import *
 from .evo_gen import *
@@ -79,34 +78,26 @@ class EVO(BaseDevice):
                 if start_date <= date <= end_date
             }
 
-        # For data types that are stored with a datetime string as a key in a tuple
+        # For time series, stored as Series and keyed by datetime strings (in a tuple
+        # with the timezone offset for biometrics)
         elif data_type in [
             "bpm",
             "brpm",
             "spo2",
             "hrv",
+            "steps",
+            "distance",
         ]:
-            return {
-                key: value
-                for key, value in data.items()
-                if start_datetime <= key[0] <= end_datetime
-            }
+            return series_to_dict(data[start_datetime:end_datetime])
 
-        # For steps and distance that use datetime strings as keys (assuming distance also has datetime as per steps)
-        elif data_type in ["steps", "distance"]:
-            return {
-                datetime: value
-                for datetime, value in data.items()
-                if start_datetime <= datetime <= end_datetime
-            }
+        elif data_type == "sleep_session":
+            return series_to_dict(data)
 
         else:
             return data
 
     def _gen_synthetic(self):
-        # generate random data according to seed
-        seed_everything(self.init_params["seed"])
-        # and based on start and end dates
+        # generate random data according to seed and based on start and end dates
         (
             self.activities,
             self.bpm,
@@ -125,6 +116,7 @@ class EVO(BaseDevice):
         ) = create_syn_data(
             self.init_params["synthetic_start_date"],
             self.init_params["synthetic_end_date"],
+            self.init_params["seed"],
         )
 
     # We get the access token to make requests to the Biostrap API
@@ -1,11 +1,193 @@
-import math
-import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+def _mean_reverting_walk(initial, target, rate, noise, lower, upper, block_size=4096):
+    """Computes a bounded mean-reverting random walk with vectorized filtering.
+
+    Each step follows ``x[t] = x[t-1] + rate * (target - x[t-1]) + noise[t]`` and is
+    then clamped to ``[lower, upper]``. Between clamps this is a first order linear
+    recurrence, so it is evaluated with an IIR filter one block at a time. When the
+    walk leaves its bounds, that step is clamped and filtering restarts from the
+    clamped value, giving the same result as clamping in a Python loop.
+
+    :param initial: the value of the walk before the first step
+    :type initial: float
+    :param target: the mean the walk reverts to
+    :type target: float
+    :param rate: the fraction of the distance to the target recovered at each step
+    :type rate: float
+    :param noise: the noise added at each step, one entry per step
+    :type noise: np.ndarray
+    :param lower: the lower bound of the walk
+    :type lower: float
+    :param upper: the upper bound of the walk
+    :type upper: float
+    :param block_size: the number of steps filtered at once, defaults to 4096
+    :type block_size: int, optional
+    :return: the walk, clamped to ``[lower, upper]`` at every step
+    :rtype: np.ndarray
+    """
+    inputs = rate * target + np.asarray(noise, dtype=float)
+    walk = np.empty(len(inputs))
+
+    current = initial
+    start = 0
+    while start < len(inputs):
+        block, _ = lfilter(
+            [1.0],
+            [1.0, rate - 1.0],
+            inputs[start : start + block_size],
+            zi=[(1.0 - rate) * current],
+        )
+
+        # Keep the block up to the first step out of bounds, clamp that step and
+        # continue the walk from it
+        out_of_bounds = np.flatnonzero((block < lower) | (block > upper))
+        if len(out_of_bounds) > 0:
+            block = block[: out_of_bounds[0] + 1]
+            block[-1] = min(max(block[-1], lower), upper)
+
+        walk[start : start + len(block)] = block
+        current = block[-1]
+        start += len(block)
+
+    return walk
+
+
+# A single 10 second tick of the biometrics sampled at that rate, stored together so
+# that all readings of a tick sit next to each other in memory. The readings are
+# whole numbers within narrow bounds (bpm 40-120, hrv 20-100, spo2 95-100), so the
+# smallest integer types that hold them are enough
+BIOMETRICS_DTYPE = np.dtype(
+    [
+        ("ts", "datetime64[s]"),
+        ("bpm", np.int16),
+        ("hrv", np.int16),
+        ("spo2", np.int8),
+    ]
+)
+
+
+def _gen_biometrics(timestamps, rng):
+    """Generates the raw bpm, brpm, hrv and spo2 readings.
+
+    bpm, hrv and spo2 are sampled every 10 seconds and returned together as a
+    structured array with ``BIOMETRICS_DTYPE``. brpm is sampled once a minute, i.e.
+    on every sixth 10 second tick, and returned as its own array.
+
+    :param timestamps: the timestamp of each 10 second tick
+    :type timestamps: np.ndarray of datetime64[s]
+    :param rng: the random number generator to draw the noise from
+    :type rng: np.random.Generator
+    :return: the bpm, hrv and spo2 readings, and the brpm readings
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    n = len(timestamps)
+
+    # Draw the Gaussian noise for each biometric up front, with more realistic
+    # (reduced) standard deviations
+    noise_bpm = rng.standard_normal(n) * 2
+    noise_brpm = rng.standard_normal(n // 6) * 0.5
+    noise_hrv = rng.standard_normal(n) * 1
+    noise_spo2 = rng.standard_normal(n) * 0.05
+
+    biometrics = np.empty(n, dtype=BIOMETRICS_DTYPE)
+    biometrics["ts"] = timestamps
+
+    # Update bpm, hrv, and spo2 every 10 seconds (truncated by the integer fields)
+    biometrics["bpm"] = _mean_reverting_walk(
+        initial=45,
+        target=70,
+        rate=0.01,
+        noise=noise_bpm,
+        lower=40,
+        upper=120,
+    )
+    biometrics["hrv"] = _mean_reverting_walk(
+        initial=40,
+        target=50,
+        rate=0.1,
+        noise=noise_hrv,
+        lower=20,
+        upper=100,
+    )
+    biometrics["spo2"] = _mean_reverting_walk(
+        initial=98,
+        target=98,
+        rate=0.1,
+        noise=noise_spo2,
+        lower=95,
+        upper=100,
+    )
 
+    # Update brpm every minute
+    brpm_values = _mean_reverting_walk(
+        initial=16,
+        target=16,
+        rate=0.1,
+        noise=noise_brpm,
+        lower=12,
+        upper=20,
+    ).astype(np.int8)
 
-def create_syn_data(start_date, end_date):
+    return biometrics, brpm_values
+
+
+def _sleeping_hours(ticks_per_day, num_days):
+    """Flags the ticks that fall within typical sleeping hours (11 PM to 6 AM).
+
+    The flags only depend on the time of day, so they are computed once for a single
+    day and repeated for every day, which assumes the ticks cover whole days starting
+    at midnight.
+
+    :param ticks_per_day: the number of evenly spaced ticks in a day
+    :type ticks_per_day: int
+    :param num_days: the number of days covered by the ticks
+    :type num_days: int
+    :return: for each tick, whether it falls within sleeping hours
+    :rtype: np.ndarray of bool
+    """
+    hours = np.arange(ticks_per_day) * 24 // ticks_per_day
+    return np.tile((23 <= hours) | (hours < 6), num_days)
+
+
+def series_to_dict(series):
+    """Converts a synthetic time series to the dict format returned by the Biostrap API.
+
+    Keys are datetime strings in the format "YYYY-MM-DD HH:MM:SS", paired in a tuple
+    with the timezone offset in minutes when the series is timezone aware (as the
+    biometrics are). The offset is taken per reading, so timezones with daylight
+    saving time are supported.
+
+    :param series: the time series
+    :type series: pd.Series
+    :return: the readings keyed by their datetime
+    :rtype: Dict
+    """
+    index = series.index
+    tz_offsets = None
+    if index.tz is not None:
+        local = index.tz_localize(None)
+        utc = index.tz_convert("UTC").tz_localize(None)
+        tz_offsets = ((local - utc) // pd.Timedelta(minutes=1)).tolist()
+        index = local
+
+    # much faster than formatting with DatetimeIndex.strftime
+    datetime_strs = [
+        dt.replace("T", " ")
+        for dt in np.datetime_as_string(index.to_numpy(), unit="s").tolist()
+    ]
+    if tz_offsets is not None:
+        datetime_strs = list(zip(datetime_strs, tz_offsets))
+
+    return dict(zip(datetime_strs, series.tolist()))
+
+
+def create_syn_data(start_date, end_date, seed=0):
     """
     Generates synthetic data collected by Biostrap between a given start and end date.
 
@@ -13,197 +195,113 @@ def create_syn_data(start_date, end_date):
     :type start_date: str
     :param end_date: End date (inclusive) as a string in the format "YYYY-MM-DD"
     :type end_date: str
+    :param seed: Seed for the random number generator, defaults to 0
+    :type seed: int, optional
 
     :return: A tuple consisting of:
         - activities: Dictionary containing details of a random synthetic activity
-        - bpm: Dictionary representing beats per minute for every 10 seconds throughout the range
-        - brpm: Dictionary representing breaths per minute based on bpm values for every minute throughout the range
-        - hrv: Dictionary representing heart rate variability for every 10 seconds throughout the range
-        - spo2: Dictionary representing blood oxygen saturation for every 10 seconds
+        - bpm: Series representing beats per minute for every 10 seconds throughout the range
+        - brpm: Series representing breaths per minute for every minute throughout the range
+        - hrv: Series representing heart rate variability for every 10 seconds throughout the range
+        - spo2: Series representing blood oxygen saturation for every 10 seconds
         - rest_cals: Dictionary representing resting calories burned each day
         - work_cals: Dictionary representing workout calories burned each day
         - active_cals: Dictionary representing active calories burned each day
         - step_cals: Dictionary representing calories burned from steps each day
         - total_cals: Dictionary representing total calories burned each day
-        - sleep_session: Dictionary representing moments of movement during typical sleeping hours
+        - sleep_session: Series representing moments of movement during typical sleeping hours
         - sleep_detail: Dictionary representing details of a synthetic sleep session
-        - steps: Dictionary representing steps taken every minute throughout the range
-        - distance: Dictionary representing distance covered (based on steps) every minute throughout the range
+        - steps: Series representing steps taken every minute throughout the range
+        - distance: Series representing distance covered (based on steps) every minute throughout the range
+
+        The biometrics (and sleep session) are indexed by timezone aware datetimes and
+        steps and distance by naive ones, use ``series_to_dict`` to convert any of the
+        series to the format returned by the Biostrap API.
 
-    :rtype: Tuple[Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict, Dict]
+    :rtype: Tuple[Dict, pd.Series, pd.Series, pd.Series, pd.Series, Dict, Dict, Dict, Dict, Dict, pd.Series, Dict, pd.Series, pd.Series]
     """
 
     # Convert the provided strings to datetime objects
     start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
     end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
 
-    TZ_OFFSET = -420
+    TZ = timezone(timedelta(minutes=-420))
 
-    # Adjusted Gaussian noise functions for each biometric with more realistic standard deviations
-    def gaussian_noise_bpm():
-        return np.random.normal(0, 2)  # Reduced standard deviation for less noise
+    rng = np.random.default_rng(seed)
 
-    def gaussian_noise_brpm():
-        return np.random.normal(0, 0.5)  # Reduced standard deviation for less noise
+    def synthetic_biometrics(start_date_obj, end_date_obj):
+        # One reading every 10 seconds, from the start date through the end of the end date
+        num_days = (end_date_obj - start_date_obj).days + 1
+        n = num_days * 24 * 60 * 6
+        timestamps = np.datetime64(start_date_obj, "s") + np.arange(n) * np.timedelta64(
+            10, "s"
+        )
 
-    def gaussian_noise_hrv():
-        return np.random.normal(0, 1)  # Reduced standard deviation for less noise
+        biometrics, brpm_values = _gen_biometrics(timestamps, rng)
+        index = pd.DatetimeIndex(biometrics["ts"]).tz_localize(TZ)
 
-    def gaussian_noise_spo2():
-        return np.random.normal(0, 0.05)  # Reduced standard deviation for minimal noise
-
-    def synthetic_biometrics(start_date_obj, end_date_obj):
-        bpm = {}
-        brpm = {}
-        hrv = {}
-        spo2 = {}
-
-        curr_date_obj = start_date_obj
-        time_index = 0
-
-        # Initial values for random walk
-        bpm_current = 45
-        brpm_current = 16
-        hrv_current = 40
-        spo2_current = 98
-
-        # Target means and bounds
-        target_mean_bpm = 70
-        target_mean_brpm = 16
-        target_mean_hrv = 50
-        target_mean_spo2 = 98
-
-        bpm_lower_bound, bpm_upper_bound = 40, 120
-        brpm_lower_bound, brpm_upper_bound = 12, 20
-        hrv_lower_bound, hrv_upper_bound = 20, 100
-        spo2_lower_bound, spo2_upper_bound = 95, 100
-
-        # Store the last minute's average bpm to calculate brpm
-        last_minute_bpm = []
-
-        while curr_date_obj <= end_date_obj:
-            curr_time = curr_date_obj
-            while curr_time < curr_date_obj + timedelta(days=1):
-                key = (curr_time.strftime("%Y-%m-%d %H:%M:%S"), TZ_OFFSET)
-
-                # Update bpm, hrv, and spo2 every 10 seconds
-                bpm_mean_reversion = (
-                    target_mean_bpm - bpm_current
-                ) * 0.01  # Changed from 0.1
-                bpm_current += bpm_mean_reversion + gaussian_noise_bpm()
-                bpm_current = max(bpm_lower_bound, min(bpm_upper_bound, bpm_current))
-                bpm[key] = int(bpm_current)
-
-                hrv_mean_reversion = (target_mean_hrv - hrv_current) * 0.1
-                hrv_current += hrv_mean_reversion + gaussian_noise_hrv()
-                hrv_current = max(hrv_lower_bound, min(hrv_upper_bound, hrv_current))
-                hrv[key] = int(hrv_current)
-
-                spo2_mean_reversion = (target_mean_spo2 - spo2_current) * 0.1
-                spo2_current += spo2_mean_reversion + gaussian_noise_spo2()
-                spo2_current = max(
-                    spo2_lower_bound, min(spo2_upper_bound, spo2_current)
-                )
-                spo2[key] = int(spo2_current)
-
-                # Update brpm every minute
-                if time_index % 60 == 0:
-                    brpm_mean_reversion = (target_mean_brpm - brpm_current) * 0.1
-                    brpm_current += brpm_mean_reversion + gaussian_noise_brpm()
-                    brpm_current = max(
-                        brpm_lower_bound, min(brpm_upper_bound, brpm_current)
-                    )
-                    brpm[key] = int(brpm_current)
-
-                # Increment time and index
-                curr_time += timedelta(seconds=10)
-                time_index += 10
-
-            curr_date_obj += timedelta(days=1)
+        # The series wrap the generated arrays without copying them
+        bpm = pd.Series(biometrics["bpm"], index=index, copy=False)
+        brpm = pd.Series(brpm_values, index=index[::6], copy=False)
+        hrv = pd.Series(biometrics["hrv"], index=index, copy=False)
+        spo2 = pd.Series(biometrics["spo2"], index=index, copy=False)
 
         return bpm, brpm, hrv, spo2
 
-    def synthetic_steps_distance_per_minute(bpm_dict):
-        steps_dict = {}
-        distance_dict = {}
-
+    def synthetic_steps_distance_per_minute(bpm):
         # For each minute, we'll check the BPM to determine steps
-        for key, bpm_value in bpm_dict.items():
-            dt, _ = key
-
-            # Extracting hour to check for sleeping hours
-            curr_hour = int(dt.split(" ")[1].split(":")[0])
-
-            if dt.endswith("00"):  # Checking if it's on a per-minute mark
-                if 23 <= curr_hour or curr_hour < 6:  # typical sleeping hours
-                    steps = random.choice(
-                        [0, 0, 0, 0, 1, 2]
-                    )  # Mostly zero, but sometimes a small number indicating tossing/turning in sleep
-                elif bpm_value < 60:
-                    steps = random.randint(0, 20)  # Relatively calm/resting
-                elif bpm_value < 80:
-                    steps = random.randint(20, 40)  # Maybe just light walking
-                else:
-                    steps = random.randint(40, 120)  # Active movement or jogging
-
-                distance = steps * random.uniform(0.7, 0.8)
-                date_str = dt.split()[0]
-                time_str = dt.split()[1]
-
-                steps_dict[f"{date_str} {time_str}"] = steps
-                distance_dict[f"{date_str} {time_str}"] = distance
-
-        return steps_dict, distance_dict
-
-    def synthetic_daily_calories(bpm_dict, steps_dict):
-        rest_cals_dict = {}
-        work_cals_dict = {}
-        active_cals_dict = {}
-        step_cals_dict = {}
-        total_cals_dict = {}
-
-        daily_bpm_averages = {}
-
-        # Precompute average BPM per day
-        for (dt, _), v in bpm_dict.items():
-            date_str = dt.split(" ")[0]
-            daily_bpm_averages.setdefault(date_str, []).append(v)
-
-        # Compute average BPM for each day
-        for date_str, bpm_vals in daily_bpm_averages.items():
-            avg_bpm = sum(bpm_vals) / len(bpm_vals)
-            daily_bpm_averages[date_str] = avg_bpm
-
-        # Calculate calories based on the precomputed average BPMs
-        for date_str, avg_bpm in daily_bpm_averages.items():
-            if avg_bpm < 60:
-                active_cals = random.randint(50, 100)  # relatively inactive
-            elif avg_bpm < 80:
-                active_cals = random.randint(100, 200)  # moderately active
-            else:
-                active_cals = random.randint(200, 300)  # very active
-
-            steps_val = sum(
-                [val for dt, val in steps_dict.items() if dt.startswith(date_str)]
-            )
-
-            rest_cals_dict[date_str] = random.randint(1000, 1300)
-            work_cals_dict[date_str] = random.randint(300, 600)
-            step_cals_dict[date_str] = steps_val * 0.05
-            active_cals_dict[date_str] = active_cals
-            total_cals_dict[date_str] = (
-                rest_cals_dict[date_str]
-                + work_cals_dict[date_str]
-                + step_cals_dict[date_str]
-                + active_cals_dict[date_str]
-            )
+        on_minute = bpm.index.second == 0
+        minutes = bpm.index[on_minute].tz_localize(None)
+        bpm_per_minute = bpm.to_numpy()[on_minute]
+        n = len(minutes)
+
+        # Checking for typical sleeping hours
+        sleeping = _sleeping_hours(24 * 60, n // (24 * 60))
+
+        # Relatively calm/resting, maybe just light walking, or active movement/jogging
+        resting = bpm_per_minute < 60
+        walking = bpm_per_minute < 80
+        low = np.select([resting, walking], [0, 20], 40)
+        high = np.select([resting, walking], [20, 40], 120)
+
+        # While asleep steps are mostly zero, but sometimes a small number indicating
+        # tossing/turning in sleep
+        sleep_steps = rng.choice([0, 0, 0, 0, 1, 2], size=n)
+        steps = np.where(
+            sleeping, sleep_steps, rng.integers(low, high, endpoint=True)
+        ).astype(np.int16)
+        distance = steps * rng.uniform(0.7, 0.8, size=n)
+
+        return pd.Series(steps, index=minutes), pd.Series(distance, index=minutes)
+
+    def synthetic_daily_calories(bpm, steps):
+        # Precompute average BPM and total steps per day, summing steps in 64 bits as
+        # a day of them overflows their storage type
+        daily_bpm_averages = bpm.resample("D").mean()
+        daily_steps = steps.astype(np.int64).resample("D").sum()
+        num_days = len(daily_bpm_averages)
+
+        # Calculate calories based on the precomputed average BPMs: relatively
+        # inactive, moderately active or very active
+        inactive = daily_bpm_averages.to_numpy() < 60
+        moderate = daily_bpm_averages.to_numpy() < 80
+        active_low = np.select([inactive, moderate], [50, 100], 200)
+        active_high = np.select([inactive, moderate], [100, 200], 300)
+
+        rest_cals = rng.integers(1000, 1300, num_days, endpoint=True)
+        work_cals = rng.integers(300, 600, num_days, endpoint=True)
+        active_cals = rng.integers(active_low, active_high, endpoint=True)
+        step_cals = daily_steps.to_numpy() * 0.05
+        total_cals = rest_cals + work_cals + step_cals + active_cals
+
+        date_strs = daily_bpm_averages.index.strftime("%Y-%m-%d").tolist()
 
         return (
-            rest_cals_dict,
-            work_cals_dict,
-            active_cals_dict,
-            step_cals_dict,
-            total_cals_dict,
+            dict(zip(date_strs, rest_cals.tolist())),
+            dict(zip(date_strs, work_cals.tolist())),
+            dict(zip(date_strs, active_cals.tolist())),
+            dict(zip(date_strs, step_cals.tolist())),
+            dict(zip(date_strs, total_cals.tolist())),
         )
 
     def synthetic_activity():
@@ -212,29 +310,32 @@ def create_syn_data(start_date, end_date):
             "%Y-%m-%d"
         )  # choose a day in the middle of the range
 
+        intensities = ["light", "moderate", "high"]
+
+        # Draw all integer fields at once: duration (minutes), calories burned,
+        # average bpm, peak bpm, steps taken and the intensity index
+        duration, calories, avg_bpm, peak_bpm, steps_taken, intensity = rng.integers(
+            [20, 200, 80, 150, 3000, 0],
+            [60, 500, 150, 180, 10000, len(intensities) - 1],
+            endpoint=True,
+        ).tolist()
+
         return {
             "activity_date": activity_date,
             "type": "Running",
-            "duration": timedelta(minutes=random.randint(20, 60)),
-            "distance": random.uniform(3, 10),
-            "calories_burned": random.randint(200, 500),
-            "avg_bpm": random.randint(80, 150),
-            "peak_bpm": random.randint(150, 180),
-            "steps_taken": random.randint(3000, 10000),
-            "intensity": random.choice(["light", "moderate", "high"]),
+            "duration": timedelta(minutes=duration),
+            "distance": rng.uniform(3, 10),
+            "calories_burned": calories,
+            "avg_bpm": avg_bpm,
+            "peak_bpm": peak_bpm,
+            "steps_taken": steps_taken,
+            "intensity": intensities[intensity],
         }
 
-    def synthetic_sleep_session(bpm_dict):
-        # Extracting nighttime bpm readings
-        night_movements = {
-            k: v
-            for k, v in bpm_dict.items()
-            if 23 <= int(k[0].split(" ")[1].split(":")[0])
-            or int(k[0].split(" ")[1].split(":")[0]) < 6
-        }
-        # Filter out readings where bpm indicates deep sleep (low bpm)
-        night_movements = {k: v for k, v in night_movements.items() if v > 65}
-        return night_movements
+    def synthetic_sleep_session(bpm):
+        # Nighttime bpm readings, leaving out readings where bpm indicates deep sleep (low bpm)
+        night = _sleeping_hours(24 * 60 * 6, len(bpm) // (24 * 60 * 6))
+        return bpm[night & (bpm.to_numpy() > 65)]
 
     def synthetic_sleep_detail():
         sleep_date = (start_date_obj + (end_date_obj - start_date_obj) / 2).strftime(
@@ -242,8 +343,12 @@ def create_syn_data(start_date, end_date):
         )
         total_sleep_duration = 8  # Assuming 8 hours sleep
 
-        light_sleep = random.uniform(0.4, 0.6) * total_sleep_duration
-        deep_sleep = random.uniform(0.2, 0.3) * total_sleep_duration
+        light_fraction, deep_fraction, awake_time = rng.uniform(
+            [0.4, 0.2, 0.1], [0.6, 0.3, 0.3]
+        ).tolist()
+
+        light_sleep = light_fraction * total_sleep_duration
+        deep_sleep = deep_fraction * total_sleep_duration
         rem_sleep = total_sleep_duration - (light_sleep + deep_sleep)
 
         return {
@@ -251,8 +356,8 @@ def create_syn_data(start_date, end_date):
             "light_sleep": light_sleep,
             "deep_sleep": deep_sleep,
             "rem_sleep": rem_sleep,
-            "awake_time": random.uniform(0.1, 0.3),
-            "times_awoken": random.randint(1, 5),
+            "awake_time": awake_time,
+            "times_awoken": int(rng.integers(1, 5, endpoint=True)),
         }
 
     # Generate biometric, steps, and distance data
@@ -8,6 +8,21 @@ from .fitbit_sense_gen import *
 
 class_name = "Fitbit_sense"
 
+# keys under which each data type is nested in the synthetic data, None for data
+# types that are returned as is
+SYNTHETIC_DATA_KEYS = {
+    "sleep": "sleep",
+    "steps": "activities-steps",
+    "minutesVeryActive": "activities-minutesVeryActive",
+    "minutesLightlyActive": "activities-minutesLightlyActive",
+    "minutesFairlyActive": "activities-minutesFairlyActive",
+    "distance": "activities-distance",
+    "minutesSedentary": "activities-minutesSedentary",
+    "hrv": "hrv",
+    "distance_day": None,
+    "heart_rate_day": None,
+}
+
 
 class Fitbit_sense(BaseDevice):
     """This device allows you to work with data from the `Fitbit Sense <(https://www.fitbit.com/global/us/products/smartwatches/sense)>`_ device.
@@ -66,6 +81,11 @@ class Fitbit_sense(BaseDevice):
             },
         )
 
+        # parsed once here, as every call to _filter_synthetic slices relative to it
+        self._syn_start_dt = datetime.strptime(
+            self.init_params["synthetic_start_date"], "%Y-%m-%d"
+        )
+
     def _default_params(self):
         params = {
             "seed": 0,
@@ -77,38 +97,20 @@ class Fitbit_sense(BaseDevice):
 
     def _filter_synthetic(self, data, data_type, params):
 
+        key = SYNTHETIC_DATA_KEYS[data_type]
+        if key is None:
+            return data
+
         date_format = "%Y-%m-%d"
-        date1 = datetime.strptime(self.init_params["synthetic_start_date"], date_format)
-        date2 = datetime.strptime(params["start_date"], date_format)
-
-        date3 = datetime.strptime(self.init_params["synthetic_end_date"], date_format)
-        date4 = datetime.strptime(params["end_date"], date_format)
-
-        delta1 = date2 - date1
-        delta2 = date3 - date4
-
-        num_days_start = delta1.days
-        num_days_end = delta2.days
-
-        key_map = {
-            "sleep": "sleep",
-            "steps": "activities-steps",
-            "minutesVeryActive": "activities-minutesVeryActive",
-            "minutesLightlyActive": "activities-minutesLightlyActive",
-            "minutesFairlyActive": "activities-minutesFairlyActive",
-            "distance": "activities-distance",
-            "minutesSedentary": "activities-minutesSedentary",
-            "hrv": "hrv",
-            "distance_day": None,
-            "heart_rate_day": None,
-        }
+        start_date = datetime.strptime(params["start_date"], date_format)
+        end_date = datetime.strptime(params["end_date"], date_format)
+
+        # synthetic data holds one entry per day starting at the synthetic start date,
+        # so the requested (inclusive) date range maps directly to a slice
+        start = max((start_date - self._syn_start_dt).days, 0)
+        stop = max((end_date - self._syn_start_dt).days + 1, 0)
 
-        if data_type in key_map:
-            key = key_map[data_type]
-            if key is None:
-                return data
-            intermediary = data[0][key][num_days_start : -num_days_end + 1]
-            return [{key: intermediary}]
+        return [{key: data[0][key][start:stop]}]
 
     def _get_real(self, data_type, params):
 
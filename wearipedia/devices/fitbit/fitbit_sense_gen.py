@@ -1,4 +1,6 @@
 import collections
+import copy
+import functools
 import random
 from datetime import datetime, time, timedelta
 from random import choice, choices, randrange
@@ -364,6 +366,15 @@ def create_syn_data(seed, start_date, end_date):
     :rtype: defaultdict
     """
 
+    # generation is deterministic in its arguments, so reuse previous results but
+    # hand out a copy so callers never share (and mutate) the cached data
+    return copy.deepcopy(_create_syn_data(seed, start_date, end_date))
+
+
+@functools.lru_cache(maxsize=8)
+def _create_syn_data(seed, start_date, end_date):
+    """Memoized implementation of :func:`create_syn_data`, see there for details."""
+
     random.seed(seed)
 
     num_days = (
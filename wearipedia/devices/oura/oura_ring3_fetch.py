@@ -1,7 +1,12 @@
 import requests
+from requests.adapters import HTTPAdapter
 
 __all__ = ["fetch_real_data"]
 
+# reuse connections (and TLS sessions) to the API across calls
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 
 def call_api_version_2(
     url: str,
@@ -18,7 +23,9 @@ def call_api_version_2(
     headers = {"Authorization": "Bearer " + access_token}
     params = {start_date_col: start_date, end_date_col: end_date}
 
-    response = requests.request(call, url=url, headers=headers, params=params)
+    response = _session.request(
+        call, url=url, headers=headers, params=params, timeout=10
+    )
 
     # Handle specific HTTP status codes
     if response.status_code != 200: